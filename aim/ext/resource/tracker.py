@@ -1,11 +1,12 @@
 import io
 import logging
+import math
 import re
 import sys
 import time
 import weakref
 
-from threading import Thread
+from threading import Event, Thread
 from typing import Union
 from weakref import WeakValueDictionary
 
@@ -17,6 +18,9 @@ from psutil import Process, cpu_percent
 
 logger = logging.getLogger(__name__)
 
+# matches the ANSI cursor movement (CSI) sequences
+ANSI_CSI_RE = re.compile(b'\001?\033\\[((?:\\d|;)*)([a-dA-D])\002?')
+
 
 class ResourceTracker(object):
     _buffer_registry = WeakValueDictionary()
@@ -105,7 +109,7 @@ class ResourceTracker(object):
 
         # Start thread to collect stats and logs at intervals
         self._th_collector = Thread(target=self._stat_collector, daemon=True)
-        self._shutdown = False
+        self._shutdown = Event()
         self._started = False
 
         if ResourceTracker.reset_cpu_cycle is False:
@@ -132,7 +136,7 @@ class ResourceTracker(object):
         if not self._started:
             return
 
-        self._shutdown = True
+        self._shutdown.set()
         self._th_collector.join()
         if self._capture_logs:
             # read and store remaining buffered logs
@@ -166,31 +170,31 @@ class ResourceTracker(object):
         """
         Statistics collecting thread body
         """
-        stat_time_counter = 0
-        log_capture_time_counter = 0
-
         # store initial system usage stats
         if self._stat_capture_interval:
             stat = Stat(self._process)
             self._track(stat)
 
+        now = time.monotonic()
+        next_stat_time = now + self._stat_capture_interval if self._stat_capture_interval else math.inf
+        next_log_capture_time = now + self._log_capture_interval if self._capture_logs else math.inf
+
         while True:
-            # Get system statistics
-            if self._shutdown:
+            # sleep until the stats or logs are due, wake up right away if stop() is called
+            next_time = min(next_stat_time, next_log_capture_time)
+            timeout = None if next_time == math.inf else max(next_time - time.monotonic(), 0)
+            if self._shutdown.wait(timeout):
                 break
 
-            time.sleep(0.1)
-            stat_time_counter += 0.1
-            log_capture_time_counter += 0.1
-
-            if self._stat_capture_interval and stat_time_counter > self._stat_capture_interval:
+            now = time.monotonic()
+            if now >= next_stat_time:
                 stat = Stat(self._process)
                 self._track(stat)
-                stat_time_counter = 0
+                next_stat_time = now + self._stat_capture_interval
 
-            if self._capture_logs and log_capture_time_counter > self._log_capture_interval:
+            if now >= next_log_capture_time:
                 self._store_buffered_logs()
-                log_capture_time_counter = 0
+                next_log_capture_time = now + self._log_capture_interval
 
     def _store_buffered_logs(self):
         _buffer_size = self._io_buffer.tell()
@@ -204,13 +208,12 @@ class ResourceTracker(object):
         # handle the buffered data and store
 
         lines = data.split(b'\n')
-        ansi_csi_re = re.compile(b'\001?\033\\[((?:\\d|;)*)([a-dA-D])\002?')
 
         def _handle_csi(line):
             def _remove_csi(line):
-                return re.sub(ansi_csi_re, b'', line)
+                return ANSI_CSI_RE.sub(b'', line)
 
-            for match in ansi_csi_re.finditer(line):
+            for match in ANSI_CSI_RE.finditer(line):
                 arg, command = match.groups()
                 arg = int(arg.decode()) if arg else 1
                 if command == b'A':  # cursor up
@@ -222,8 +225,9 @@ class ResourceTracker(object):
 
         line = None
         for line in lines:
-            # handle cursor up and down symbols
-            line = _handle_csi(line)
+            # handle cursor up and down symbols, most of the lines have none of them
+            if b'\033' in line:
+                line = _handle_csi(line)
             # handle each line for carriage returns
             line = line.rsplit(b'\r')[-1]
             self._tracker()(LogLine(line.decode()), name='logs', step=self._line_counter)
@@ -214,6 +214,8 @@ class TensorboardFolderTracker:
 
 
 class TensorboardEvent:
+    __slots__ = ('value', 'name', 'step', 'context')
+
     def __init__(self, value: Any, name: str, step: int, context: dict) -> None:
         self.value = value
         self.name = name
@@ -226,7 +228,6 @@ class TensorboardEventConsumer:
         self._tracker = weakref.ref(tracker)
         self._queue = queue
         self._thread = threading.Thread(target=self._process_events, daemon=True)
-        self._shutdown = False
         self._started = False
 
     def start(self):
@@ -237,17 +238,14 @@ class TensorboardEventConsumer:
 
     def _process_events(self):
         while True:
-            try:
-                event = self._queue.get(True, 1)
-                if event:
-                    self._tracker()(event.value, event.name, event.step, context=event.context)
-            except queue.Empty:
-                event = None
-                if self._shutdown:
-                    break
+            event = self._queue.get()
+            # `None` is put by stop() after all the folder watchers are stopped
+            if event is None:
+                break
+            self._tracker()(event.value, event.name, event.step, context=event.context)
 
     def stop(self):
         if not self._started:
             return
-        self._shutdown = True
+        self._queue.put(None)
         self._thread.join()
@@ -42,6 +42,9 @@ class Client:
             remote_path = remote_path[:-1]
         self._remote_path = remote_path
 
+        # keep-alive connections are reused by all the requests to the server
+        self._session = requests.Session()
+
         self._http_protocol = 'http://'
         self._ws_protocol = 'ws://'
         self.request_headers = {}
@@ -74,7 +77,7 @@ class Client:
     def protocol_probe(self):
         endpoint = f'http://{self.remote_path}/status/'
         try:
-            response = requests.get(endpoint, headers=self.request_headers, timeout=10)
+            response = self._session.get(endpoint, headers=self.request_headers, timeout=10)
             if response.status_code == 200:
                 if response.url.startswith('https://'):
                     self._http_protocol = 'https://'
@@ -85,7 +88,7 @@ class Client:
 
         endpoint = f'https://{self.remote_path}/status/'
         try:
-            response = requests.get(endpoint, headers=self.request_headers, timeout=10, verify=self.ssl_certfile)
+            response = self._session.get(endpoint, headers=self.request_headers, timeout=10, verify=self.ssl_certfile)
             if response.status_code == 200:
                 self._http_protocol = 'https://'
                 self._ws_protocol = 'wss://'
@@ -141,7 +144,7 @@ class Client:
 
     def client_heartbeat(self):
         endpoint = f'{self._http_protocol}{self._client_endpoint}/heartbeat/{self.uri}/'
-        response = requests.get(endpoint, headers=self.request_headers, timeout=10, verify=self.ssl_certfile)
+        response = self._session.get(endpoint, headers=self.request_headers, timeout=10, verify=self.ssl_certfile)
         response_json = response.json()
         if response.status_code != 200:
             raise_exception(response_json.get('message'))
@@ -154,7 +157,7 @@ class Client:
     )
     def connect(self):
         endpoint = f'{self._http_protocol}{self._client_endpoint}/connect/{self.uri}/'
-        response = requests.get(endpoint, headers=self.request_headers, timeout=10, verify=self.ssl_certfile)
+        response = self._session.get(endpoint, headers=self.request_headers, timeout=10, verify=self.ssl_certfile)
         response_json = response.json()
         if response.status_code != 200:
             raise_exception(response_json.get('message'))
@@ -163,7 +166,7 @@ class Client:
 
     def reconnect(self):
         endpoint = f'{self._http_protocol}{self._client_endpoint}/reconnect/{self.uri}/'
-        response = requests.get(endpoint, headers=self.request_headers, timeout=10, verify=self.ssl_certfile)
+        response = self._session.get(endpoint, headers=self.request_headers, timeout=10, verify=self.ssl_certfile)
         response_json = response.json()
         if response.status_code != 200:
             raise_exception(response_json.get('message'))
@@ -179,10 +182,14 @@ class Client:
             self._ws.close()
 
         endpoint = f'{self._http_protocol}{self._client_endpoint}/disconnect/{self.uri}/'
-        response = requests.get(endpoint, headers=self.request_headers, timeout=10, verify=self.ssl_certfile)
-        response_json = response.json()
-        if response.status_code != 200:
-            raise_exception(response_json.get('message'))
+        try:
+            response = self._session.get(endpoint, headers=self.request_headers, timeout=10, verify=self.ssl_certfile)
+            response_json = response.json()
+            if response.status_code != 200:
+                raise_exception(response_json.get('message'))
+        finally:
+            # the heartbeat thread and the queue worker are stopped by now, release the pooled connections
+            self._session.close()
 
         return response
 
@@ -190,7 +197,7 @@ class Client:
         self,
     ):
         endpoint = f'{self._http_protocol}{self._client_endpoint}/get-version/'
-        response = requests.get(endpoint, headers=self.request_headers, timeout=10, verify=self.ssl_certfile)
+        response = self._session.get(endpoint, headers=self.request_headers, timeout=10, verify=self.ssl_certfile)
         response_json = response.json()
         if response.status_code == 404:
             return '<3.19.0'
@@ -207,7 +214,9 @@ class Client:
             'args': base64.b64encode(args).decode(),
         }
 
-        response = requests.post(endpoint, json=request_data, headers=self.request_headers, verify=self.ssl_certfile)
+        response = self._session.post(
+            endpoint, json=request_data, headers=self.request_headers, verify=self.ssl_certfile
+        )
         response_json = response.json()
         if response.status_code == 400:
             raise_exception(response_json.get('exception'))
@@ -224,7 +233,7 @@ class Client:
         if queue_id != -1:
             self.get_queue().wait_for_finish()
 
-        response = requests.get(endpoint, headers=self.request_headers, timeout=10, verify=self.ssl_certfile)
+        response = self._session.get(endpoint, headers=self.request_headers, timeout=10, verify=self.ssl_certfile)
         response_json = response.json()
         if response.status_code == 400:
             raise_exception(response_json.get('exception'))
@@ -264,7 +273,7 @@ class Client:
         if queue_id != -1:
             self.get_queue().wait_for_finish()
 
-        response = requests.post(
+        response = self._session.post(
             endpoint, json=request_data, stream=True, headers=self.request_headers, verify=self.ssl_certfile
         )
 
@@ -298,18 +307,27 @@ class Client:
         )
         del self._thread_local.atomic_instructions[hash_]
 
+    def _open_ws(self):
+        return connect(
+            f'{self._ws_protocol}{self._tracking_endpoint}/{self.uri}/write-instruction/',
+            additional_headers=self.request_headers,
+            max_size=None,
+            ssl_context=self.ssl_context,
+        )
+
     def refresh_ws(self):
-        self._ws = connect(f'{self._ws_protocol}{self._tracking_endpoint}/{self.uri}/write-instruction/', max_size=None)
+        if self._ws is not None:
+            # close the superseded connection, otherwise its socket is leaked on every reconnect
+            try:
+                self._ws.close()
+            except Exception:
+                pass
+        self._ws = self._open_ws()
 
     @property
     def ws(self):
         if self._ws is None:
-            self._ws = connect(
-                f'{self._ws_protocol}{self._tracking_endpoint}/{self.uri}/write-instruction/',
-                additional_headers=self.request_headers,
-                max_size=None,
-                ssl_context=self.ssl_context,
-            )
+            self._ws = self._open_ws()
 
         return self._ws
 
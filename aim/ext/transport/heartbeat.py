@@ -1,10 +1,9 @@
 import datetime
 import logging
-import time
 import weakref
 
 from collections import Counter
-from threading import Thread
+from threading import Event, Thread
 from typing import Union
 
 
@@ -34,7 +33,7 @@ class HeartbeatSender(object):
 
         # Start thread to collect stats and logs at intervals
         self._th_collector = Thread(target=self._target_f, daemon=True)
-        self._shutdown = False
+        self._shutdown = Event()
         self._started = False
 
     def start(self):
@@ -48,7 +47,7 @@ class HeartbeatSender(object):
         if not self._started:
             return
 
-        self._shutdown = True
+        self._shutdown.set()
         self._th_collector.join()
 
     def _send_heartbeat(self):
@@ -69,11 +68,8 @@ class HeartbeatSender(object):
         # send initial heartbeat
         self._send_heartbeat()
 
-        while True:
-            if self._shutdown:
-                break
-
-            time.sleep(1)
+        # wake up every second, or immediately when stop() is called
+        while not self._shutdown.wait(1):
             heartbeat_interval_counter += 1
             stability_check_interval_counter += 1
 
@@ -125,7 +121,7 @@ class HeartbeatWatcher:
 
         # Start thread to collect stats and logs at intervals
         self._th_collector = Thread(target=self._interval_check, daemon=True)
-        self._shutdown = False
+        self._shutdown = Event()
         self._started = False
 
     def start(self):
@@ -139,7 +135,7 @@ class HeartbeatWatcher:
         if not self._started:
             return
 
-        self._shutdown = True
+        self._shutdown.set()
         self._th_collector.join()
 
     def _release_client_resources(self, dead_client_uri):
@@ -151,16 +147,14 @@ class HeartbeatWatcher:
         ClientRouter.remove_client(dead_client_uri)
 
     def _interval_check(self):
-        while True:
-            # Get system statistics
-            if self._shutdown:
-                break
-
-            time.sleep(1)
-
+        while not self._shutdown.wait(1):
             client_uris = list(self._heartbeat_pool.keys())
             for client_uri in client_uris:
+                # the client may have disconnected since the keys were listed
+                last_heartbeat = self._heartbeat_pool.get(client_uri)
+                if last_heartbeat is None:
+                    continue
                 now = datetime.datetime.now().timestamp()
-                if now - self._heartbeat_pool[client_uri] > self._client_keep_alive_time:
+                if now - last_heartbeat > self._client_keep_alive_time:
                     self._release_client_resources(client_uri)
-                    del self._heartbeat_pool[client_uri]
+                    self._heartbeat_pool.pop(client_uri, None)
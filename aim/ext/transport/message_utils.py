@@ -10,26 +10,41 @@ from aim.storage.treeutils import encode_tree as encode_tree
 from aim.storage.types import BLOB
 
 
+_size_struct = struct.Struct('I')
+_blob_flags = {False: struct.pack('?', False), True: struct.pack('?', True)}
+
+
+def _pack_item(key: bytes, val) -> Tuple[bytes, ...]:
+    is_blob = isinstance(val, BLOB)
+    if is_blob:
+        val = val.load()
+    return _size_struct.pack(len(key)), key, _blob_flags[is_blob], _size_struct.pack(len(val)), val
+
+
 def pack_args(tree: Iterator[Tuple[bytes, bytes]]) -> bytes:
+    # collect the parts of all the items and copy them into the result at once
     result = []
     for key, val in tree:
-        if not isinstance(val, BLOB):
-            result.append(struct.pack('I', len(key)) + key + struct.pack('?', False) + struct.pack('I', len(val)) + val)
-        else:
-            val = val.load()
-            result.append(struct.pack('I', len(key)) + key + struct.pack('?', True) + struct.pack('I', len(val)) + val)
+        result.extend(_pack_item(key, val))
 
     return b''.join(result)
 
 
 def unpack_args(args: bytes) -> Tuple[bytes, bytes]:
-    while args:
-        (key_size,), args_tail = struct.unpack('I', args[:4]), args[4:]
-        key, args_tail = args_tail[:key_size], args_tail[key_size:]
-        (is_blob,), args_tail = struct.unpack('?', args_tail[:1]), args_tail[1:]
-        (value_size,), args_tail = struct.unpack('I', args_tail[:4]), args_tail[4:]
-        value, args_tail = args_tail[:value_size], args_tail[value_size:]
-        args = args_tail
+    # walk the buffer by offset, slicing out only keys and values instead of copying the remaining tail
+    size_len = _size_struct.size
+    offset, end = 0, len(args)
+    while offset < end:
+        (key_size,) = _size_struct.unpack_from(args, offset)
+        offset += size_len
+        key = args[offset : offset + key_size]
+        offset += key_size
+        is_blob = args[offset] != 0
+        offset += 1
+        (value_size,) = _size_struct.unpack_from(args, offset)
+        offset += size_len
+        value = args[offset : offset + value_size]
+        offset += value_size
         if is_blob:
             yield key, BLOB(data=value)
         else:
@@ -39,11 +54,7 @@ def unpack_args(args: bytes) -> Tuple[bytes, bytes]:
 def pack_stream(tree: Iterator[Tuple[bytes, bytes]]) -> bytes:
     # TODO: [MV] check the performance diff of current version vs collecting the whole tree as a chunk
     for key, val in tree:
-        if not isinstance(val, BLOB):
-            yield struct.pack('I', len(key)) + key + struct.pack('?', False) + struct.pack('I', len(val)) + val
-        else:
-            val = val.load()
-            yield struct.pack('I', len(key)) + key + struct.pack('?', True) + struct.pack('I', len(val)) + val
+        yield b''.join(_pack_item(key, val))
 
 
 def unpack_stream(stream) -> Tuple[bytes, bytes]:
@@ -1,11 +1,12 @@
 import datetime
 
+from aim.ext.transport.tracking import TrackingRouter
 from fastapi import APIRouter
 
 
 class ClientRouter:
     client_heartbeat_pool = dict()
-    clients = []
+    clients = set()
 
     def __init__(self):
         self.router = APIRouter()
@@ -22,12 +23,11 @@ class ClientRouter:
 
     @classmethod
     def add_client(cls, client_uri):
-        cls.clients.append(client_uri)
+        cls.clients.add(client_uri)
 
     @classmethod
     def remove_client(cls, client_uri):
-        if client_uri in cls.clients:
-            cls.clients.remove(client_uri)
+        cls.clients.discard(client_uri)
 
     async def get_version(self):
         from aim.__version__ import __version__ as aim_version
@@ -41,8 +41,10 @@ class ClientRouter:
         self.add_client(client_uri)
 
     async def reconnect(self, client_uri):
-        if client_uri not in self.clients:
-            self.add_client(client_uri)
+        self.add_client(client_uri)
 
     async def disconnect(self, client_uri):
         self.remove_client(client_uri)
+        # release the client resources right away, instead of waiting for the heartbeat watcher to time out
+        self.client_heartbeat_pool.pop(client_uri, None)
+        TrackingRouter.cleanup_client_resources(client_uri)
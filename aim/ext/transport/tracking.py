@@ -1,8 +1,9 @@
+import asyncio
 import base64
 import logging
 import uuid
 
-from typing import Dict, List, Union
+from typing import Dict, Set, Union
 
 from aim.ext.transport.message_utils import (
     ResourceObject,
@@ -42,25 +43,33 @@ class ResourceTypeRegistry:
 
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         await websocket.send_text(message)
 
     async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            await connection.send_text(message)
+        # send to a snapshot, connections may be added or removed while the sends are awaited
+        connections = list(self.active_connections)
+        # send concurrently, so a slow client doesn't hold back the rest
+        results = await asyncio.gather(*(conn.send_text(message) for conn in connections), return_exceptions=True)
+
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(connection)
 
 
 class TrackingRouter:
     resource_pool = dict()
+    # client_uri -> resource handlers, to clean up a client without scanning the whole pool
+    client_resources: Dict[str, Set[str]] = dict()
     manager = ConnectionManager()
 
     def __init__(self, resource_registry: ResourceTypeRegistry):
@@ -86,19 +95,34 @@ class TrackingRouter:
         self.router.add_api_websocket_route('/{client_uri}/write-instruction/', self.run_write_instructions)
         self.router.add_api_websocket_route('/{client_uri}/write-instruction', self.run_write_instructions)
 
+    @classmethod
+    def _add_resource(cls, client_uri, resource_handler, resource):
+        cls._remove_resource(resource_handler)
+        cls.resource_pool[resource_handler] = (client_uri, resource)
+        cls.client_resources.setdefault(client_uri, set()).add(resource_handler)
+
+    @classmethod
+    def _remove_resource(cls, resource_handler):
+        res_info = cls.resource_pool.pop(resource_handler, None)
+        if res_info is None:
+            return
+        client_handlers = cls.client_resources.get(res_info[0])
+        if client_handlers is not None:
+            client_handlers.discard(resource_handler)
+            if not client_handlers:
+                cls.client_resources.pop(res_info[0], None)
+
     @classmethod
     def cleanup_client_resources(cls, dead_client_uri):
-        resource_handlers = list(cls.resource_pool.keys())
-        for handler in resource_handlers:
-            (client_uri, _) = cls.resource_pool[handler]
-            if dead_client_uri == client_uri:
-                del cls.resource_pool[handler]
+        for handler in cls.client_resources.pop(dead_client_uri, ()):
+            cls.resource_pool.pop(handler, None)
 
     @classmethod
     def _verify_resource_handler(cls, resource_handler, client_uri):
         res_info = cls.resource_pool.get(resource_handler, None)
         if not res_info or res_info[0] != client_uri:
             raise UnauthorizedRequestError(resource_handler)
+        return res_info[1].ref
 
     async def get_resource(
         self,
@@ -121,8 +145,7 @@ class TrackingRouter:
                 for argname, arg in kwargs.items():
                     if isinstance(arg, ResourceObject):
                         handler = arg.storage['handler']
-                        self._verify_resource_handler(handler, client_uri)
-                        checked_kwargs[argname] = self.resource_pool[handler][1].ref
+                        checked_kwargs[argname] = self._verify_resource_handler(handler, client_uri)
                     else:
                         checked_kwargs[argname] = arg
 
@@ -130,16 +153,13 @@ class TrackingRouter:
             else:
                 res = resource_cls()
 
-            self.resource_pool[resource_handler] = (client_uri, res)
+            self._add_resource(client_uri, resource_handler, res)
             return {'handler': resource_handler}
 
         except Exception as e:
-            try:
-                # clean up resource_pool
-                # because no one will call release_resource in case of Exception
-                del self.resource_pool[resource_handler]
-            except KeyError:
-                pass
+            # clean up resource_pool
+            # because no one will call release_resource in case of Exception
+            self._remove_resource(resource_handler)
 
             logger.debug(f'Caught exception {e}. Sending response 400.')
             return JSONResponse(
@@ -152,7 +172,7 @@ class TrackingRouter:
     async def release_resource(self, client_uri, resource_handler):
         try:
             self._verify_resource_handler(resource_handler, client_uri)
-            del self.resource_pool[resource_handler]
+            self._remove_resource(resource_handler)
         except Exception as e:
             logger.debug(f'Caught exception {e}. Sending response 400.')
             return JSONResponse(
@@ -173,7 +193,7 @@ class TrackingRouter:
             method_name = request_data.get('method_name')
             args = request_data.get('args')
 
-            self._verify_resource_handler(resource_handler, client_uri)
+            resource = self._verify_resource_handler(resource_handler, client_uri)
 
             args = decode_tree(unpack_args(base64.b64decode(args)))
 
@@ -181,12 +201,10 @@ class TrackingRouter:
             for arg in args:
                 if isinstance(arg, ResourceObject):
                     handler = arg.storage['handler']
-                    self._verify_resource_handler(handler, client_uri)
-                    checked_args.append(self.resource_pool[handler][1].ref)
+                    checked_args.append(self._verify_resource_handler(handler, client_uri))
                 else:
                     checked_args.append(arg)
 
-            resource = self.resource_pool[resource_handler][1].ref
             if method_name.endswith('.setter'):
                 attr_name = method_name.split('.')[0]
                 setattr(resource, attr_name, checked_args[0])
@@ -217,17 +235,15 @@ class TrackingRouter:
                 write_instructions = decode_tree(unpack_args(raw_message))
                 for instruction in write_instructions:
                     resource_handler, method_name, args = instruction
-                    self._verify_resource_handler(resource_handler, client_uri)
+                    resource = self._verify_resource_handler(resource_handler, client_uri)
                     checked_args = []
                     for arg in args:
                         if isinstance(arg, ResourceObject):
                             handler = arg.storage['handler']
-                            self._verify_resource_handler(handler, client_uri)
-                            checked_args.append(self.resource_pool[handler][1].ref)
+                            checked_args.append(self._verify_resource_handler(handler, client_uri))
                         else:
                             checked_args.append(arg)
 
-                    resource = self.resource_pool[resource_handler][1].ref
                     if method_name.endswith('.setter'):
                         attr_name = method_name.split('.')[0]
                         setattr(resource, attr_name, checked_args[0])
@@ -239,7 +255,10 @@ class TrackingRouter:
 
                 await websocket.send_bytes(b'OK')
         except WebSocketDisconnect:
-            self.manager.disconnect(websocket)
+            pass
 
         except Exception as e:
             await websocket.send_bytes(pack_args(encode_tree(build_exception(e))))
+        finally:
+            # the connection is closed once the handler returns, don't keep it in the registry
+            self.manager.disconnect(websocket)
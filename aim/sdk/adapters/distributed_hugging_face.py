@@ -16,7 +16,6 @@ import json
 import logging
 import select
 import socket
-import struct
 import threading
 import time
 import typing
@@ -40,17 +39,14 @@ class IncompleteDataError(IncompletePackageError):
 
 
 def packet_encode(usage: typing.Dict[str, typing.Any]) -> bytes:
-    data = json.dumps(usage)
-    header = len(data).to_bytes(4, 'big')
-    packet = b''.join((header, struct.pack(f'!{len(data)}s', data.encode('utf-8'))))
-    return packet
+    data = json.dumps(usage).encode('utf-8')
+    # the header holds the payload size in bytes, the payload follows as is
+    return len(data).to_bytes(4, 'big') + data
 
 
 def packet_decode(packet: bytes) -> typing.Dict[str, typing.Any]:
     length = int.from_bytes(packet[:4], 'big')
-    raw = struct.unpack_from(f'!{length}s', packet, 4)[0]
-    decoded = json.loads(raw)
-    return decoded
+    return json.loads(packet[4 : 4 + length])
 
 
 class ResourceTrackerForwarder(aim.ext.resource.ResourceTracker):
@@ -83,7 +79,7 @@ class MetricsReporter:
         self.tracker.start()
 
     def stop(self):
-        if self.tracker._shutdown is False:
+        if not self.tracker._shutdown.is_set():
             self.tracker.stop()
         if self.client is not None:
             self.client.close()
@@ -127,7 +123,7 @@ class MetricsReporter:
                 'rank': self.rank,
             },
         }
-        self.log.debug(f'Send {raw}')
+        self.log.debug('Send %s', raw)
 
         packet = packet_encode(raw)
         try:
@@ -503,7 +503,7 @@ class RunStatusReporter:
         idx = self.counter + 1
         self.counter = idx
 
-        logger.debug(f'incrementing {flag_name} idx -> {idx}')
+        logger.debug('incrementing %s idx -> %s', flag_name, idx)
 
         check_in = CheckIn(idx=idx, expect_next_in=expect_next_in, flag_name=flag_name)
 
@@ -519,7 +519,7 @@ class RunStatusReporter:
             # Schedule to flush ASAP
             timed_task = TimedTask(when=0, flag_name=flag_name)
             self._schedule(timed_task)
-            logger.debug(f'scheduled {timed_task} ASAP because no physical check-in was found')
+            logger.debug('scheduled %s ASAP because no physical check-in was found', timed_task)
         else:
             if was_scheduled.when > check_in.expiry_date:
                 # Schedule to flush ASAP
@@ -532,7 +532,7 @@ class RunStatusReporter:
                 # flag to `True` and inserting the new item with the same
                 # `flag_name`. The writer thread will just ignore such items.
                 was_scheduled.overwritten = True
-                logger.debug(f'scheduled {timed_task} because it newer is stricter than {was_scheduled}')
+                logger.debug('scheduled %s because it newer is stricter than %s', timed_task, was_scheduled)
 
         return check_in
 
@@ -589,14 +589,14 @@ class RunStatusReporter:
             # next appropriate flush time. It is either the remaining time from
             # the previous flush, or the moment new check-in is registered.
             with self.refresh_condition:
-                logger.debug(f'no interesting things to do, sleeping for {remaining}')
+                logger.debug('no interesting things to do, sleeping for %s', remaining)
                 logger.debug('until woken up')
-                logger.debug(f'unfinished tasks: {self.queue.unfinished_tasks}')
+                logger.debug('unfinished tasks: %s', self.queue.unfinished_tasks)
                 self.refresh_condition.wait(timeout=remaining)
 
             timed_task: Optional[TimedTask]
             try:
-                timed_task = self.queue.get(timeout=0)
+                timed_task = self.queue.get_nowait()
             except queue.Empty:
                 timed_task = None
             else:
@@ -610,14 +610,14 @@ class RunStatusReporter:
                 remaining = timed_task.when - time.monotonic() - PLAN_ADVANCE_TIME
                 # remaining = max(remaining, MIN_SUSPEND_TIME)
                 remaining = min(remaining, MAX_SUSPEND_TIME)
-                logger.debug(f'time remaining: {remaining}')
+                logger.debug('time remaining: %s', remaining)
 
                 if remaining > 0:
                     # TODO Should we push a little late?
                     self._schedule(timed_task)
-                    logger.debug(f'too soon, {remaining} remaining')
-                    logger.debug(f'putting back for the future: {timed_task}')
-                    logger.debug(f'now: {time.monotonic()}... scheduled for: {timed_task.when}')
+                    logger.debug('too soon, %s remaining', remaining)
+                    logger.debug('putting back for the future: %s', timed_task)
+                    logger.debug('now: %s... scheduled for: %s', time.monotonic(), timed_task.when)
                     self.queue.task_done()
                     # Mark the task to signal about the clean state.
                     timed_task = None
@@ -633,7 +633,7 @@ class RunStatusReporter:
                 if self.stop_signal.is_set():
                     return
             else:
-                logger.debug(f'only {remaining} remaining... flushing one task')
+                logger.debug('only %s remaining... flushing one task', remaining)
                 self._touch_flag(timed_task.flag_name)
                 self.queue.task_done()
                 # Let's immediately proceed to the next iteration to check if
@@ -652,13 +652,13 @@ class RunStatusReporter:
         Otherwise, all the check-ins will be flushed. In this case, the order
         of (active) check-ins (per flag name) will be preserved.
         """
-        logger.debug(f'notifying {self}')
+        logger.debug('notifying %s', self)
 
         with self.reporter_lock:
             flag_names = [flag_name] if flag_name is not None else list(self.timed_tasks)
             with self.flush_condition:
                 for flag_name in flag_names:
-                    logger.debug(f'flushing {flag_name}')
+                    logger.debug('flushing %s', flag_name)
                     # We add a new task with the highest priority to flush the
                     # last check-in. This task will be processed by the writer
                     # thread immediately.
@@ -168,7 +168,6 @@ class WorkerThread(Thread):
 
 class NotificationQueue(object):
     def __init__(self, notifier: Notifier):
-        self._stopped = False
         self._notifier = notifier
 
         self._queue = queue.Queue()
@@ -184,31 +183,30 @@ class NotificationQueue(object):
         self._queue.join()
         logger.debug('Notifications queue is empty.')
         logger.debug('Stopping worker thread...')
-        self._stopped = True
+        self._queue.put(None)
         self._notifier_thread.join()
         logger.debug('Worker thread stopped.')
 
     def listen(self):
         while True:
-            if self._stopped:
-                break
-            try:
-                notification = self._queue.get(timeout=1)
-                if notification.is_sent():
-                    logger.debug(
-                        f"Notification for object '{notification.obj_idx}' "
-                        f'with event ID {notification.rank} has already been sent. Skipping.'
-                    )
-                else:
-                    details = notification.get_msg_details()
-                    try:
-                        self._notifier.notify(notification.message, **details)
-                        notification.update_last_sent()
-                    except NotificationSendError as e:
-                        logger.error(f'Failed to send notification. Reason: {e}.')
+            notification = self._queue.get()
+            # `None` is put by stop() once all the pending notifications are processed
+            if notification is None:
                 self._queue.task_done()
-            except queue.Empty:
-                continue
+                break
+            if notification.is_sent():
+                logger.debug(
+                    f"Notification for object '{notification.obj_idx}' "
+                    f'with event ID {notification.rank} has already been sent. Skipping.'
+                )
+            else:
+                details = notification.get_msg_details()
+                try:
+                    self._notifier.notify(notification.message, **details)
+                    notification.update_last_sent()
+                except NotificationSendError as e:
+                    logger.error(f'Failed to send notification. Reason: {e}.')
+            self._queue.task_done()
 
 
 class RunStatusWatcherAutoClean(AutoClean['RunStatusWatcher']):
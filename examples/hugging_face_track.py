@@ -6,13 +6,15 @@ from datasets import load_dataset
 from transformers import (
     AutoModelForSequenceClassification,
     AutoTokenizer,
+    DataCollatorWithPadding,
     Trainer,
     TrainingArguments,
 )
 
 
 def tokenize_function(examples):
-    return tokenizer(examples['text'], padding='max_length', truncation=True)
+    # padding is done per batch by the data collator
+    return tokenizer(examples['text'], truncation=True)
 
 
 def compute_metrics(eval_pred):
@@ -26,10 +28,9 @@ dataset = load_dataset('yelp_review_full')
 
 tokenizer = AutoTokenizer.from_pretrained('bert-base-cased')
 
-tokenized_datasets = dataset.map(tokenize_function, batched=True)
-
-small_train_dataset = tokenized_datasets['train'].shuffle(seed=42).select(range(1000))
-small_eval_dataset = tokenized_datasets['test'].shuffle(seed=42).select(range(1000))
+# select the samples first, so that only they are tokenized
+small_train_dataset = dataset['train'].shuffle(seed=42).select(range(1000)).map(tokenize_function, batched=True)
+small_eval_dataset = dataset['test'].shuffle(seed=42).select(range(1000)).map(tokenize_function, batched=True)
 
 metric = evaluate.load('accuracy')
 
@@ -45,6 +46,7 @@ trainer = Trainer(
     args=training_args,
     train_dataset=small_train_dataset,
     eval_dataset=small_eval_dataset,
+    data_collator=DataCollatorWithPadding(tokenizer),
     compute_metrics=compute_metrics,
     callbacks=[aim_callback],
 )
@@ -35,9 +35,15 @@ train_dataset = torchvision.datasets.MNIST(root='./data/', train=True, transform
 test_dataset = torchvision.datasets.MNIST(root='./data/', train=False, transform=transforms.ToTensor())
 
 # Data loader
-train_loader = torch.utils.data.DataLoader(dataset=train_dataset, batch_size=batch_size, shuffle=True)
+# pinned host memory lets the batches be copied to the gpu asynchronously
+pin_memory = device.type == 'cuda'
+train_loader = torch.utils.data.DataLoader(
+    dataset=train_dataset, batch_size=batch_size, shuffle=True, pin_memory=pin_memory
+)
 
-test_loader = torch.utils.data.DataLoader(dataset=test_dataset, batch_size=batch_size, shuffle=False)
+test_loader = torch.utils.data.DataLoader(
+    dataset=test_dataset, batch_size=batch_size, shuffle=False, pin_memory=pin_memory
+)
 
 
 # Convolutional neural network (two convolutional layers)
@@ -76,8 +82,8 @@ optimizer = torch.optim.Adam(model.parameters(), lr=learning_rate)
 total_step = len(train_loader)
 for epoch in range(num_epochs):
     for i, (images, labels) in enumerate(train_loader):
-        images = images.to(device)
-        labels = labels.to(device)
+        images = images.to(device, non_blocking=True)
+        labels = labels.to(device, non_blocking=True)
 
         # Forward pass
         outputs = model(images)
@@ -89,10 +95,10 @@ for epoch in range(num_epochs):
         optimizer.step()
 
         if i % 30 == 0:
+            # read the loss value once, every `.item()` call syncs with the device
+            loss_val = loss.item()
             logging.info(
-                'Epoch [{}/{}], Step [{}/{}], Loss: {:.4f}'.format(
-                    epoch + 1, num_epochs, i + 1, total_step, loss.item()
-                )
+                'Epoch [{}/{}], Step [{}/{}], Loss: {:.4f}'.format(epoch + 1, num_epochs, i + 1, total_step, loss_val)
             )
 
             # aim - Track model loss function
@@ -104,7 +110,7 @@ for epoch in range(num_epochs):
             acc = 100 * correct / total
 
             # aim - Track metrics
-            items = {'accuracy': acc, 'loss': loss}
+            items = {'accuracy': acc, 'loss': loss_val}
             aim_run.track(items, epoch=epoch, context={'subset': 'train'})
 
             # aim - Track weights and gradients distributions
@@ -113,8 +119,7 @@ for epoch in range(num_epochs):
 
             # TODO: Do actual validation
             if i % 300 == 0:
-                aim_run.track(loss.item(), name='loss', epoch=epoch, context={'subset': 'val'})
-                aim_run.track(acc, name='accuracy', epoch=epoch, context={'subset': 'val'})
+                aim_run.track(items, epoch=epoch, context={'subset': 'val'})
 
 
 # Test the model
@@ -122,8 +127,8 @@ with torch.inference_mode():
     correct = 0
     total = 0
     for images, labels in test_loader:
-        images = images.to(device)
-        labels = labels.to(device)
+        images = images.to(device, non_blocking=True)
+        labels = labels.to(device, non_blocking=True)
         outputs = model(images)
         _, predicted = torch.max(outputs.data, 1)
         total += labels.size(0)
@@ -36,9 +36,15 @@ train_dataset = torchvision.datasets.MNIST(root='./data/', train=True, transform
 test_dataset = torchvision.datasets.MNIST(root='./data/', train=False, transform=transforms.ToTensor())
 
 # Data loader
-train_loader = torch.utils.data.DataLoader(dataset=train_dataset, batch_size=batch_size, shuffle=True)
+# pinned host memory lets the batches be copied to the gpu asynchronously
+pin_memory = device.type == 'cuda'
+train_loader = torch.utils.data.DataLoader(
+    dataset=train_dataset, batch_size=batch_size, shuffle=True, pin_memory=pin_memory
+)
 
-test_loader = torch.utils.data.DataLoader(dataset=test_dataset, batch_size=batch_size, shuffle=False)
+test_loader = torch.utils.data.DataLoader(
+    dataset=test_dataset, batch_size=batch_size, shuffle=False, pin_memory=pin_memory
+)
 
 
 # Convolutional neural network (two convolutional layers)
@@ -79,9 +85,8 @@ tensor_to_pil = transforms.ToPILImage()
 total_step = len(train_loader)
 for epoch in range(num_epochs):
     for i, (images, labels) in tqdm(enumerate(train_loader), total=len(train_loader)):
-        images = images.to(device)
-        labels = labels.to(device)
-        aim_images = convert_to_aim_image_list(images, labels)
+        images = images.to(device, non_blocking=True)
+        labels = labels.to(device, non_blocking=True)
 
         # Forward pass
         outputs = model(images)
@@ -93,15 +98,12 @@ for epoch in range(num_epochs):
         optimizer.step()
 
         if i % 30 == 0:
+            # read the loss value once, every `.item()` call syncs with the device
+            loss_val = loss.item()
             logging.info(
-                'Epoch [{}/{}], Step [{}/{}], Loss: {:.4f}'.format(
-                    epoch + 1, num_epochs, i + 1, total_step, loss.item()
-                )
+                'Epoch [{}/{}], Step [{}/{}], Loss: {:.4f}'.format(epoch + 1, num_epochs, i + 1, total_step, loss_val)
             )
 
-            # aim - Track model loss function
-            aim_run.track(loss.item(), name='loss', epoch=epoch, context={'subset': 'train'})
-
             correct = 0
             total = 0
             _, predicted = torch.max(outputs.data, 1)
@@ -110,14 +112,16 @@ for epoch in range(num_epochs):
             acc = 100 * correct / total
 
             # aim - Track metrics
-            aim_run.track(acc, name='accuracy', epoch=epoch, context={'subset': 'train'})
+            items = {'accuracy': acc, 'loss': loss_val}
+            aim_run.track(items, epoch=epoch, context={'subset': 'train'})
 
+            # convert the batch to images only on the steps it is tracked
+            aim_images = convert_to_aim_image_list(images, labels)
             aim_run.track(aim_images, name='images', epoch=epoch, context={'subset': 'train'})
 
             # TODO: Do actual validation
             if i % 300 == 0:
-                aim_run.track(loss, name='loss', epoch=epoch, context={'subset': 'val'})
-                aim_run.track(acc, name='accuracy', epoch=epoch, context={'subset': 'val'})
+                aim_run.track(items, epoch=epoch, context={'subset': 'val'})
                 aim_run.track(aim_images, name='images', epoch=epoch, context={'subset': 'val'})
 
 
@@ -126,8 +130,8 @@ with torch.inference_mode():
     correct = 0
     total = 0
     for images, labels in tqdm(test_loader, total=len(test_loader)):
-        images = images.to(device)
-        labels = labels.to(device)
+        images = images.to(device, non_blocking=True)
+        labels = labels.to(device, non_blocking=True)
         outputs = model(images)
         _, predicted = torch.max(outputs.data, 1)
         total += labels.size(0)
@@ -0,0 +1,93 @@
+import struct
+import unittest
+
+from aim.ext.transport.message_utils import _blob_flags, pack_args, pack_stream, unpack_args, unpack_stream
+from aim.storage.types import BLOB
+
+
+def _size(n: int) -> bytes:
+    return struct.pack('I', n)
+
+
+def _loaded(items):
+    return [(key, val.load() if isinstance(val, BLOB) else val) for key, val in items]
+
+
+_FRAME = (
+    _size(0) + b'\x00' + _size(0)
+    + _size(3) + b'key' + b'\x00' + _size(0)
+    + _size(1) + b'b' + b'\x01' + _size(4) + b'data'
+    + _size(1) + b'k' + b'\x00' + _size(5) + b'value'
+)  # fmt: skip
+_TREE = [(b'', b''), (b'key', b''), (b'b', b'data'), (b'k', b'value')]
+
+
+class TestTransportMessageEncoding(unittest.TestCase):
+    def test_blob_flags(self):
+        self.assertEqual(b'\x00', _blob_flags[False])
+        self.assertEqual(b'\x01', _blob_flags[True])
+
+    def test_pack_args_single_record(self):
+        expected = _size(1) + b'k' + b'\x00' + _size(1) + b'v'
+        self.assertEqual(expected, pack_args([(b'k', b'v')]))
+
+    def test_pack_args_empty_key_and_value(self):
+        expected = _size(0) + b'\x00' + _size(0) + _size(3) + b'key' + b'\x00' + _size(0)
+        self.assertEqual(expected, pack_args([(b'', b''), (b'key', b'')]))
+
+    def test_pack_args_blob_value(self):
+        expected = _size(1) + b'b' + b'\x01' + _size(4) + b'data'
+        self.assertEqual(expected, pack_args([(b'b', BLOB(data=b'data'))]))
+
+    def test_pack_args_multiple_records(self):
+        tree = [(b'a', b'1'), (b'bb', BLOB(data=b'22')), (b'ccc', b'333')]
+        expected = (
+            _size(1) + b'a' + b'\x00' + _size(1) + b'1'
+            + _size(2) + b'bb' + b'\x01' + _size(2) + b'22'
+            + _size(3) + b'ccc' + b'\x00' + _size(3) + b'333'
+        )  # fmt: skip
+        self.assertEqual(expected, pack_args(tree))
+
+    def test_pack_args_empty_tree(self):
+        self.assertEqual(b'', pack_args([]))
+
+    def test_pack_stream_one_chunk_per_record(self):
+        tree = [(b'a', b'1'), (b'', BLOB(data=b'')), (b'c', b'')]
+        expected = [
+            _size(1) + b'a' + b'\x00' + _size(1) + b'1',
+            _size(0) + b'\x01' + _size(0),
+            _size(1) + b'c' + b'\x00' + _size(0),
+        ]
+        self.assertEqual(expected, list(pack_stream(tree)))
+
+
+class TestTransportMessageDecoding(unittest.TestCase):
+    def test_unpack_args(self):
+        items = list(unpack_args(_FRAME))
+        self.assertEqual(_TREE, _loaded(items))
+        self.assertEqual([False, False, True, False], [isinstance(val, BLOB) for _, val in items])
+
+    def test_unpack_args_empty_frame(self):
+        self.assertEqual([], list(unpack_args(b'')))
+
+    def test_pack_args_round_trip(self):
+        tree = [(b'', b''), (b'key', b''), (b'b', BLOB(data=b'data')), (b'k', b'value')]
+        packed = pack_args(tree)
+        self.assertEqual(_FRAME, packed)
+        self.assertEqual(_TREE, _loaded(unpack_args(packed)))
+
+    def test_unpack_stream(self):
+        chunks = [
+            _size(1) + b'a' + b'\x00' + _size(1) + b'1',
+            _size(0) + b'\x01' + _size(0),
+            _FRAME,
+        ]
+        expected = [(b'a', b'1'), (b'', b'')] + _TREE
+        self.assertEqual(expected, _loaded(unpack_stream(chunks)))
+
+    def test_pack_stream_round_trip(self):
+        tree = [(b'a', b'1'), (b'', BLOB(data=b'')), (b'bb', BLOB(data=b'22')), (b'c', b'')]
+        chunks = list(pack_stream(tree))
+        self.assertEqual(4, len(chunks))
+        self.assertEqual(_loaded(tree), _loaded(unpack_stream(chunks)))
+        self.assertEqual([False, True, True, False], [isinstance(val, BLOB) for _, val in unpack_stream(chunks)])
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import unittest
+
+from unittest import mock
+
+from aim.ext.transport.router import ClientRouter
+from aim.ext.transport.tracking import ResourceTypeRegistry, TrackingRouter
+
+
+class _Resource:
+    @property
+    def ref(self):
+        return self
+
+
+class _Request:
+    def __init__(self, data: dict):
+        self._data = data
+
+    async def json(self):
+        return self._data
+
+
+class TrackingRouterTestBase(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.multiple(TrackingRouter, resource_pool={}, client_resources={})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        registry = ResourceTypeRegistry()
+        registry.register('Resource', _Resource)
+        self.router = TrackingRouter(registry)
+
+    def get_resource(self, client_uri, resource_handler=None, resource_type='Resource'):
+        request = _Request({'resource_handler': resource_handler, 'resource_type': resource_type, 'args': ''})
+        return asyncio.run(self.router.get_resource(client_uri, request))
+
+    def release_resource(self, client_uri, resource_handler):
+        return asyncio.run(self.router.release_resource(client_uri, resource_handler))
+
+    def assertClientHandlers(self, expected: dict):
+        self.assertEqual(expected, TrackingRouter.client_resources)
+        pool = {handler: client_uri for handler, (client_uri, _) in TrackingRouter.resource_pool.items()}
+        self.assertEqual({h: client_uri for client_uri, handlers in expected.items() for h in handlers}, pool)
+
+
+class TestTrackingRouterResources(TrackingRouterTestBase):
+    def test_get_and_release_resource(self):
+        handler = self.get_resource('client-1')['handler']
+        other_handler = self.get_resource('client-1', 'handler-2')['handler']
+        self.assertEqual('handler-2', other_handler)
+        self.assertClientHandlers({'client-1': {handler, other_handler}})
+
+        self.assertIsNone(self.release_resource('client-1', handler))
+        self.assertClientHandlers({'client-1': {other_handler}})
+
+        # the emptied client set is dropped
+        self.assertIsNone(self.release_resource('client-1', other_handler))
+        self.assertClientHandlers({})
+
+    def test_failed_get_resource_removes_handler(self):
+        self.get_resource('client-1', 'handler-1')
+        response = self.get_resource('client-1', 'handler-1', resource_type='Unknown')
+        self.assertEqual(400, response.status_code)
+        self.assertClientHandlers({})
+
+    def test_reregister_handler_under_other_client(self):
+        self.get_resource('client-1', 'handler-1')
+        self.get_resource('client-1', 'handler-2')
+        self.get_resource('client-2', 'handler-1')
+        self.assertClientHandlers({'client-1': {'handler-2'}, 'client-2': {'handler-1'}})
+
+        self.get_resource('client-2', 'handler-2')
+        self.assertClientHandlers({'client-2': {'handler-1', 'handler-2'}})
+
+    def test_release_resource_of_other_client(self):
+        self.get_resource('client-1', 'handler-1')
+        response = self.release_resource('client-2', 'handler-1')
+        self.assertEqual(400, response.status_code)
+        self.assertEqual('UnauthorizedRequestError', json.loads(response.body)['exception']['class_name'])
+        self.assertClientHandlers({'client-1': {'handler-1'}})
+
+    def test_cleanup_client_resources(self):
+        self.get_resource('client-1', 'handler-1')
+        self.get_resource('client-1', 'handler-2')
+        self.get_resource('client-2', 'handler-3')
+
+        TrackingRouter.cleanup_client_resources('client-1')
+        self.assertClientHandlers({'client-2': {'handler-3'}})
+
+        # cleaning up an unknown client is a no-op
+        TrackingRouter.cleanup_client_resources('client-1')
+        self.assertClientHandlers({'client-2': {'handler-3'}})
+
+
+class TestClientRouterDisconnect(TrackingRouterTestBase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.multiple(ClientRouter, client_heartbeat_pool={}, clients=set())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client_router = ClientRouter()
+
+    def test_disconnect_releases_client_resources(self):
+        asyncio.run(self.client_router.connect('client-1'))
+        asyncio.run(self.client_router.heartbeat('client-1'))
+        self.get_resource('client-1', 'handler-1')
+        self.get_resource('client-2', 'handler-2')
+
+        asyncio.run(self.client_router.disconnect('client-1'))
+        self.assertNotIn('client-1', ClientRouter.clients)
+        self.assertNotIn('client-1', ClientRouter.client_heartbeat_pool)
+        self.assertClientHandlers({'client-2': {'handler-2'}})
+
+        # a release arriving after the disconnect is rejected, the resource is already gone
+        response = self.release_resource('client-1', 'handler-1')
+        self.assertEqual(400, response.status_code)
+        self.assertEqual('UnauthorizedRequestError', json.loads(response.body)['exception']['class_name'])